@@ -4,18 +4,33 @@ HTML5 to Video Converter - Core Logic
 Standalone converter classes without UI dependencies
 """
 import os
+import base64
+import io
 import tempfile
 import zipfile
-from pathlib import Path
 import time
 import subprocess
 import shutil
-from dataclasses import dataclass
+import mmap
+import contextlib
+import functools
+import itertools
+import threading
+import queue
+import atexit
+from dataclasses import dataclass, replace
 import re
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Optional, Tuple
+from PIL import Image
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 
+try:
+    import hyperscan  # Optional: single-pass SIMD scan for HTML analysis
+except ImportError:
+    hyperscan = None
+
 
 @dataclass
 class VideoConfig:
@@ -24,12 +39,100 @@ class VideoConfig:
     height: int
     fps: int
     duration: int
-    codec: str = "libx264"
+    codec: str = "libx264"  # or "libsvtav1" (falls back to libx264 when FFmpeg lacks it)
     bitrate: str = "10M"
     animation_speed: float = 1.0  # 1.0 = normal speed, 0.85 = 15% slower, 1.5 = 50% faster
-    preset: str = "slow"
-    crf: int = 18
+    preset: str = "veryfast"  # x264 speed/size trade-off; veryfast is ~4-8x faster than slow
+    crf: int = 20
+    tune: str = "animation"  # x264 tune for flat, high-contrast motion graphics ("" = none)
+    hardware_encoding: bool = True  # use a working NVENC/VideoToolbox/QSV encoder instead of libx264/libx265
     target_format: str = "auto"  # "auto", "square", or "vertical"
+    render_workers: int = 0  # parallel headless browsers, 0 = auto
+    capture_format: str = "jpeg"  # "jpeg" (fast SIMD encode) or "png" (lossless, slower; always used at crf <= 12)
+    capture_quality: int = 95  # JPEG quality for captured frames
+
+
+# Detection patterns, compiled once per process (checked in priority order).
+# Bytes patterns so they can run directly over a memory-mapped file.
+_VIEWPORT_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    rb'viewport.*width["\s:=]+(\d+)',
+    rb'width:\s*(\d+)px',
+    rb'canvas.*width["\s:=]+(\d+)',
+    rb'<meta.*content=.*width=(\d+)',
+))
+
+_HEIGHT_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    rb'viewport.*height["\s:=]+(\d+)',
+    rb'height:\s*(\d+)px',
+    rb'canvas.*height["\s:=]+(\d+)',
+    rb'<meta.*content=.*height=(\d+)',
+))
+
+_DURATION_PATTERNS = tuple(re.compile(p, re.IGNORECASE) for p in (
+    rb'duration["\s:=]+(\d+)',
+    rb'animation.*?(\d+)s',
+    rb'setTimeout.*?(\d+)\s*\*\s*1000',
+))
+
+# Animation keywords counted in one case-insensitive pass (no lowercase copy)
+_ANIM_RE = re.compile(rb'animation|transition|transform|requestAnimationFrame', re.IGNORECASE)
+
+# Hyperscan database: every detection pattern (reported once, used to skip
+# patterns that cannot match) plus the animation keywords (reported on every
+# hit). "requestAnimationFrame" is counted through its "animation" substring.
+_HS_PATTERNS = _VIEWPORT_PATTERNS + _HEIGHT_PATTERNS + _DURATION_PATTERNS
+_HS_KEYWORD_ID = len(_HS_PATTERNS)
+_HS_DB = None
+if hyperscan is not None:
+    try:
+        _HS_DB = hyperscan.Database()
+        _HS_DB.compile(
+            expressions=[p.pattern for p in _HS_PATTERNS] + [b'animation', b'transition', b'transform'],
+            ids=list(range(len(_HS_PATTERNS))) + [_HS_KEYWORD_ID] * 3,
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH] * len(_HS_PATTERNS)
+                  + [hyperscan.HS_FLAG_CASELESS] * 3,
+        )
+    except Exception:
+        _HS_DB = None
+
+
+def _hyperscan_html(content) -> Tuple[set, int]:
+    """Scan content once; return (ids of detection patterns that matched, animation keyword count)"""
+    matched = set()
+    keyword_hits = [0]
+
+    def on_match(pattern_id, start, end, flags, context):
+        if pattern_id == _HS_KEYWORD_ID:
+            keyword_hits[0] += 1
+        else:
+            matched.add(pattern_id)
+
+    _HS_DB.scan(content, match_event_handler=on_match)
+    return matched, keyword_hits[0]
+
+
+def _map_readonly(f):
+    """Map an open binary file read-only; empty files (which mmap rejects) give b''"""
+    if os.fstat(f.fileno()).st_size == 0:
+        return contextlib.nullcontext(b'')
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _find_main_html_member(names) -> Optional[str]:
+    """
+    Pick the entry HTML file from ZIP member names, or None when there is none.
+    index.html/index.htm wins over any other page, then the shallowest path, then
+    the sorted name, so analysis and extraction always agree on the same page.
+    """
+    candidates = [name for name in names if name.lower().endswith(('.html', '.htm'))]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda name: (name.lower().rsplit('/', 1)[-1] not in ('index.html', 'index.htm'),
+                                             name.count('/'), name))
+
+
+# Parses "rgb(r, g, b)" / "rgba(r, g, b, a)" values returned by getComputedStyle
+_BG_RGB_RE = re.compile(r'(\d+),\s*(\d+),\s*(\d+)')
 
 
 class HTML5Analyzer:
@@ -39,40 +142,52 @@ class HTML5Analyzer:
     def analyze_html(html_path: str) -> dict:
         """Analyze HTML file to detect resolution and animation duration"""
 
-        with open(html_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        # Scan the page cache in place: no read copy and no UTF-8 decode
+        with open(html_path, 'rb') as f, _map_readonly(f) as content:
+            return HTML5Analyzer.analyze_content(content)
 
+    @staticmethod
+    def analyze_zip(zip_file) -> Optional[dict]:
+        """Analyze the main HTML file of a ZIP (path or file object) without extracting it; None if it has none"""
+        with zipfile.ZipFile(zip_file, 'r') as zip_ref:
+            main_html = _find_main_html_member(zip_ref.namelist())
+            if main_html is None:
+                return None
+            return HTML5Analyzer.analyze_content(zip_ref.read(main_html))
+
+    @staticmethod
+    def analyze_content(content) -> dict:
+        """Detect settings from raw HTML bytes (bytes or a read-only mmap)"""
         # Default values
         width = 1920
         height = 1080
         duration = 10
         fps = 60
 
-        # Try to find viewport/canvas dimensions
-        viewport_patterns = [
-            r'viewport.*width["\s:=]+(\d+)',
-            r'width:\s*(\d+)px',
-            r'canvas.*width["\s:=]+(\d+)',
-            r'<meta.*content=.*width=(\d+)',
-        ]
-
-        height_patterns = [
-            r'viewport.*height["\s:=]+(\d+)',
-            r'height:\s*(\d+)px',
-            r'canvas.*height["\s:=]+(\d+)',
-            r'<meta.*content=.*height=(\d+)',
-        ]
+        # With Hyperscan, one pass tells which patterns can match at all;
+        # only those are re-run through re to extract the captured number
+        if _HS_DB is not None:
+            hs_matched, animation_count = _hyperscan_html(content)
+            candidates = [p for i, p in enumerate(_HS_PATTERNS) if i in hs_matched]
+        else:
+            candidates = _HS_PATTERNS
+            animation_count = None
 
-        for pattern in viewport_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        # Try to find viewport/canvas dimensions
+        for pattern in _VIEWPORT_PATTERNS:
+            if pattern not in candidates:
+                continue
+            match = pattern.search(content)
             if match:
                 detected_width = int(match.group(1))
                 if 100 <= detected_width <= 7680:
                     width = detected_width
                     break
 
-        for pattern in height_patterns:
-            match = re.search(pattern, content, re.IGNORECASE)
+        for pattern in _HEIGHT_PATTERNS:
+            if pattern not in candidates:
+                continue
+            match = pattern.search(content)
             if match:
                 detected_height = int(match.group(1))
                 if 100 <= detected_height <= 4320:
@@ -80,14 +195,10 @@ class HTML5Analyzer:
                     break
 
         # Try to detect animation duration
-        duration_patterns = [
-            r'duration["\s:=]+(\d+)',
-            r'animation.*?(\d+)s',
-            r'setTimeout.*?(\d+)\s*\*\s*1000',
-        ]
-
-        for pattern in duration_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for pattern in _DURATION_PATTERNS:
+            if pattern not in candidates:
+                continue
+            matches = pattern.findall(content)
             if matches:
                 durations = [int(m) for m in matches if int(m) < 1000]
                 if durations:
@@ -98,8 +209,9 @@ class HTML5Analyzer:
                     break
 
         # Detect if high FPS needed (check for animation-heavy content)
-        animation_keywords = ['animation', 'transition', 'transform', 'requestAnimationFrame']
-        animation_count = sum(content.lower().count(kw) for kw in animation_keywords)
+        if animation_count is None:
+            # Only the thresholds below matter, so stop counting once past the highest one
+            animation_count = sum(1 for _ in itertools.islice(_ANIM_RE.finditer(content), 11))
 
         if animation_count > 10:
             fps = 60  # Smooth animations
@@ -161,6 +273,7 @@ class FormatCSS:
         """
 
     @staticmethod
+    @functools.lru_cache(maxsize=64)
     def detect_best_format(source_width: int, source_height: int) -> tuple:
         """
         Detect best social media format based on source aspect ratio.
@@ -287,6 +400,536 @@ class SmartUpscaler:
             ]
             return ",".join(filter_parts)
 
+# CRF at or below which frames are captured as PNG even when JPEG capture is configured
+_LOSSLESS_CAPTURE_MAX_CRF = 12
+
+# Page.captureScreenshot parameters for frame capture (viewport only). optimizeForSpeed
+# makes Chrome use its fastest encoder settings; the image is decoded by FFmpeg right away.
+_SCREENSHOT_PARAMS = {"format": "png", "captureBeyondViewport": False, "optimizeForSpeed": True}
+
+
+def _screenshot_params(config: VideoConfig) -> dict:
+    """Screenshot parameters for the configured capture format"""
+    # At visually lossless CRFs the encoder would preserve JPEG artifacts, so keep frames lossless
+    if config.capture_format == "jpeg" and config.crf > _LOSSLESS_CAPTURE_MAX_CRF:
+        return {"format": "jpeg", "quality": config.capture_quality, "captureBeyondViewport": False,
+                "optimizeForSpeed": True}
+    return _SCREENSHOT_PARAMS
+
+
+def _capture_screenshot(driver, params: dict = _SCREENSHOT_PARAMS) -> bytes:
+    """Capture the viewport through the DevTools protocol and return the encoded image bytes"""
+    result = driver.execute_cdp_cmd("Page.captureScreenshot", params)
+    return base64.b64decode(result["data"])
+
+
+# Virtual page clock, installed before any page script runs. Date, performance.now,
+# requestAnimationFrame and timers follow a counter that only moves when
+# window.__advanceClock(ms) is called, so capture speed is bound by paint, not wall time.
+# Math.random is seeded and the epoch comes from window.__clockEpoch when set, so every
+# render worker's page sees the same sequence of values.
+_VIRTUAL_CLOCK_JS = """
+(function() {
+    if (window !== window.top || window.__advanceClock) return;
+
+    var RealDate = Date;
+    var realRequestFrame = window.requestAnimationFrame.bind(window);
+    var epoch = typeof window.__clockEpoch === 'number' ? window.__clockEpoch : RealDate.now();
+    var now = 0;
+    var frameQueue = [], nextFrameId = 0;
+    var timers = {}, nextTimerId = 0;
+
+    // mulberry32 with a fixed seed
+    var randomState = 0x2545F491;
+    Math.random = function() {
+        randomState = (randomState + 0x6D2B79F5) | 0;
+        var t = Math.imul(randomState ^ (randomState >>> 15), 1 | randomState);
+        t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+
+    // A plain function rather than a subclass, so Date() without new still returns a string
+    function VirtualDate() {
+        if (new.target === undefined) return new RealDate(epoch + now).toString();
+        if (!arguments.length) return new RealDate(epoch + now);
+        return new (Function.prototype.bind.apply(RealDate, [null].concat(Array.prototype.slice.call(arguments))))();
+    }
+    VirtualDate.prototype = RealDate.prototype;
+    VirtualDate.parse = RealDate.parse;
+    VirtualDate.UTC = RealDate.UTC;
+    VirtualDate.now = function() { return epoch + now; };
+    window.Date = VirtualDate;
+    performance.now = function() { return now; };
+
+    window.requestAnimationFrame = function(callback) {
+        frameQueue.push({id: ++nextFrameId, callback: callback});
+        return nextFrameId;
+    };
+    window.cancelAnimationFrame = function(id) {
+        frameQueue = frameQueue.filter(function(entry) { return entry.id !== id; });
+    };
+
+    function addTimer(callback, delay, args, repeat) {
+        var fn = typeof callback === 'function' ? callback : function() { (0, eval)(String(callback)); };
+        var interval = Math.max(0, Number(delay) || 0);
+        timers[++nextTimerId] = {due: now + interval, fn: fn, args: args, interval: repeat ? Math.max(1, interval) : null};
+        return nextTimerId;
+    }
+    window.setTimeout = function(callback, delay) {
+        return addTimer(callback, delay, Array.prototype.slice.call(arguments, 2), false);
+    };
+    window.setInterval = function(callback, delay) {
+        return addTimer(callback, delay, Array.prototype.slice.call(arguments, 2), true);
+    };
+    window.clearTimeout = window.clearInterval = function(id) { delete timers[id]; };
+
+    function runDueTimers() {
+        for (var guard = 0; guard < 1000; guard++) {
+            var dueId = null;
+            for (var id in timers) {
+                if (timers[id].due <= now && (dueId === null || timers[id].due < timers[dueId].due)) dueId = id;
+            }
+            if (dueId === null) return;
+            var timer = timers[dueId];
+            if (timer.interval === null) { delete timers[dueId]; } else { timer.due += timer.interval; }
+            try { timer.fn.apply(window, timer.args); } catch (e) { console.error(e); }
+        }
+    }
+
+    // Step in display-frame increments so rAF-driven code sees a normal frame cadence
+    window.__advanceClock = function(ms) {
+        var target = now + Math.max(0, ms);
+        while (now < target) {
+            now = Math.min(target, now + 1000 / 60);
+            runDueTimers();
+            var callbacks = frameQueue;
+            frameQueue = [];
+            callbacks.forEach(function(entry) {
+                try { entry.callback(now); } catch (e) { console.error(e); }
+            });
+        }
+        return now;
+    };
+
+    // Same as __advanceClock, but with a real task boundary after every display frame so
+    // promise callbacks queued by timers and rAF callbacks run before the clock moves on
+    function nextTask() {
+        return new Promise(function(resolve) {
+            var channel = new MessageChannel();
+            channel.port1.onmessage = function() { channel.port1.close(); resolve(); };
+            channel.port2.postMessage(null);
+        });
+    }
+    window.__advanceClockInTasks = async function(ms) {
+        var target = now + Math.max(0, ms);
+        while (now < target) {
+            window.__advanceClock(Math.min(target - now, 1000 / 60));
+            await nextTask();
+        }
+        return now;
+    };
+    window.__clockTime = function() { return now; };
+    window.__realAnimationFrame = realRequestFrame;
+})();
+"""
+
+# Page probes installed once per document and invoked by name, so each query is a
+# single short round trip instead of re-sending and re-compiling the script body
+_PAGE_HELPERS_JS = """
+(function() {
+    function isSet(bg) {
+        return bg && bg !== 'rgba(0, 0, 0, 0)' && bg !== 'transparent';
+    }
+
+    // Predominant background color: body, then html, then the first painted container
+    window.__getBg = function() {
+        let bodyBg = window.getComputedStyle(document.body).backgroundColor;
+        if (isSet(bodyBg)) return bodyBg;
+
+        let htmlBg = window.getComputedStyle(document.documentElement).backgroundColor;
+        if (isSet(htmlBg)) return htmlBg;
+
+        let containers = document.querySelectorAll('div, main, section, #banner, .frame');
+        for (let el of containers) {
+            let bg = window.getComputedStyle(el).backgroundColor;
+            if (isSet(bg)) return bg;
+        }
+        return 'rgb(0, 0, 0)';
+    };
+
+    // [viewport width, viewport height, body width, body height]
+    window.__getDims = function() {
+        return [window.innerWidth, window.innerHeight, document.body.offsetWidth, document.body.offsetHeight];
+    };
+
+    // Put every animation system at elapsedMs; clockMs is the matching virtual clock time
+    window.__seekFrame = function(clockMs, elapsedMs) {
+        var elapsedSeconds = elapsedMs / 1000.0;
+
+        // Run timers and rAF callbacks up to this frame on the virtual clock
+        window.__advanceClock(clockMs - window.__clockTime());
+
+        // Update all paused CSS animations to exact time
+        if (window.__animationElements) {
+            window.__animationElements.forEach(function(anim) {
+                anim.currentTime = elapsedMs;
+            });
+        }
+
+        // Update time for CreateJS animations (seek to specific time)
+        if (typeof createjs !== 'undefined' && createjs.Ticker) {
+            var tickEvent = new createjs.Event("tick");
+            tickEvent.delta = 16.67; // Simulate 60fps tick
+            tickEvent.time = elapsedMs;
+            tickEvent.runTime = elapsedMs;
+            createjs.Ticker._listeners.forEach(function(listener) {
+                if (listener && listener.handleEvent) {
+                    listener.handleEvent(tickEvent);
+                }
+            });
+        }
+
+        // Update GSAP global timeline to exact time
+        if (typeof gsap !== 'undefined') {
+            if (gsap.globalTimeline) {
+                gsap.globalTimeline.time(elapsedSeconds);
+            }
+            // Also update any explicit timelines
+            if (gsap.exportRoot) {
+                gsap.exportRoot().time(elapsedSeconds);
+            }
+        }
+
+        // Update canvas animations that use requestAnimationFrame
+        if (window.animationStartTime) {
+            window.animationStartTime = Date.now() - elapsedMs;
+        }
+        // No forced reflow: Page.captureScreenshot runs style, layout and paint for the new state itself
+    };
+})();
+"""
+
+# Resolve once the load event has fired, fonts are ready and the compositor has
+# produced two real frames (one full paint cycle) - usually well under 200ms
+_AWAIT_PAINT_JS = """
+    var done = arguments[arguments.length - 1];
+    var nextFrame = window.__realAnimationFrame || window.requestAnimationFrame.bind(window);
+    function awaitPaint() {
+        document.fonts.ready.then(function() {
+            nextFrame(function() { nextFrame(function() { done(); }); });
+        });
+    }
+    if (document.readyState === 'complete') {
+        awaitPaint();
+    } else {
+        window.addEventListener('load', awaitPaint, {once: true});
+    }
+"""
+
+
+# Trigger, inspect and pause the page's animations in one async script. Real task
+# boundaries between the steps let promise callbacks queued by the page run.
+_ANIMATION_SETUP_JS = """
+    var done = arguments[arguments.length - 1];
+    var report = {messages: []};
+
+    function nextTask() {
+        return new Promise(function(resolve) {
+            var channel = new MessageChannel();
+            channel.port1.onmessage = function() { resolve(); };
+            channel.port2.postMessage(null);
+        });
+    }
+
+    (async function() {
+        // Force all CSS animations to run and apply hover states
+        var style = document.createElement('style');
+        style.innerHTML = `
+            * {
+                animation-play-state: running !important;
+                animation-delay: 0s !important;
+            }
+
+            /* Force hover states to be visible (for interactive demos) */
+            *:hover,
+            .amount:hover,
+            .button:hover {
+                /* Apply hover styles permanently for demo */
+            }
+        `;
+        document.head.appendChild(style);
+
+        // Force first interactive element to appear hovered
+        var firstInteractive = document.querySelector('.button, .amount, [class*="hover"]');
+        if (firstInteractive) {
+            firstInteractive.classList.add('force-hover');
+            var hoverStyle = document.createElement('style');
+            hoverStyle.innerHTML = '.force-hover { /* hover styles will be applied */ }';
+            document.head.appendChild(hoverStyle);
+        }
+
+        // Simulate hover on all interactive elements
+        var interactiveElements = document.querySelectorAll('a, button, [class*="hover"], [class*="interactive"]');
+        interactiveElements.forEach(function(el) {
+            el.dispatchEvent(new MouseEvent('mouseover', {bubbles: true, cancelable: true}));
+            el.dispatchEvent(new MouseEvent('mouseenter', {bubbles: true, cancelable: true}));
+        });
+
+        // Click the body to trigger any click-based animations
+        document.body.click();
+        document.body.dispatchEvent(new MouseEvent('mouseover', {bubbles: true}));
+
+        // Trigger common animation start functions
+        if (typeof startAnimation === 'function') startAnimation();
+        if (typeof start === 'function') start();
+        if (typeof init === 'function') init();
+        if (typeof play === 'function') play();
+        if (typeof animate === 'function') animate();
+
+        // CreateJS/EaselJS support (common in HTML5 ads)
+        if (typeof createjs !== 'undefined' && createjs.Ticker) {
+            report.messages.push('CreateJS detected, setting up ticker');
+            window.__createJSActive = true;
+            if (!createjs.Ticker.hasEventListener('tick')) {
+                report.messages.push('CreateJS ticker not started, starting now');
+                createjs.Ticker.framerate = 30;
+                createjs.Ticker.timingMode = createjs.Ticker.RAF;
+            }
+        }
+
+        // GSAP support
+        if (typeof gsap !== 'undefined') {
+            report.messages.push('GSAP detected');
+            window.__gsapActive = true;
+        }
+
+        // For canvas/WebGL animations
+        window.animationStartTime = Date.now();
+        window.animationEnabled = true;
+
+        // Trigger any paused videos
+        var videos = document.getElementsByTagName('video');
+        for (var i = 0; i < videos.length; i++) {
+            videos[i].play();
+        }
+
+        // Look for canvas elements and try to find their animation context
+        var canvases = document.getElementsByTagName('canvas');
+        report.messages.push('Found ' + canvases.length + ' canvas elements');
+        for (var i = 0; i < canvases.length; i++) {
+            report.messages.push('Canvas ' + i + ': ' + canvases[i].width + 'x' + canvases[i].height);
+        }
+
+        // Give animations time to initialize
+        await nextTask();
+        await window.__advanceClockInTasks(500);
+
+        // Check what CSS animations exist
+        var info = {
+            stylesheets: document.styleSheets.length,
+            animations: []
+        };
+
+        // Try to find @keyframes rules
+        try {
+            for (var i = 0; i < document.styleSheets.length; i++) {
+                var sheet = document.styleSheets[i];
+                try {
+                    var rules = sheet.cssRules || sheet.rules;
+                    for (var j = 0; j < rules.length; j++) {
+                        if (rules[j].type === CSSRule.KEYFRAMES_RULE) {
+                            info.animations.push(rules[j].name);
+                        }
+                    }
+                } catch(e) {
+                    // CORS or access issues
+                }
+            }
+        } catch(e) {}
+
+        // Count elements running CSS animations (one document-wide query, no DOM walk)
+        var animatedTargets = new Set();
+        document.getAnimations().forEach(function(anim) {
+            if (anim.animationName && anim.effect && anim.effect.target) {
+                animatedTargets.add(anim.effect.target);
+            }
+        });
+        info.animated_elements = animatedTargets.size;
+        report.info = info;
+
+        // Let animations run briefly to establish initial random states
+        await window.__advanceClockInTasks(100);
+
+        // Now pause and take control using Web Animations API for better control
+        // Store all CSS animations using Web Animations API
+        window.__animationElements = document.getAnimations();
+        window.__animationElements.forEach(function(anim) {
+            // Pause the animation at its current state
+            anim.pause();
+        });
+
+        // Store animation start time for precise control
+        window.__animationStartTime = performance.now();
+        report.paused = window.__animationElements.length;
+    })().then(function() { done(report); }, function(e) { report.error = String(e); done(report); });
+"""
+
+
+_BROWSER_PATHS = (
+    "/Applications/Comet.app/Contents/MacOS/Comet",  # macOS
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",  # macOS
+    "/Applications/Chromium.app/Contents/MacOS/Chromium",  # macOS
+    "/usr/bin/chromium",  # Linux
+    "/usr/bin/chromium-browser",  # Linux
+    "/usr/bin/google-chrome",  # Linux
+    "/usr/bin/google-chrome-stable",  # Linux
+    "/snap/bin/chromium",  # Linux snap
+    "chromium",  # PATH fallback
+    "chromium-browser",  # PATH fallback
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _find_browser_binary() -> Optional[str]:
+    """Return the first installed browser from _BROWSER_PATHS (resolved once per process)"""
+    for path in _BROWSER_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_encoders() -> str:
+    """Output of `ffmpeg -encoders`, read once per process ('' when FFmpeg can't be run)"""
+    try:
+        return subprocess.run(["ffmpeg", "-hide_banner", "-encoders"], capture_output=True,
+                              universal_newlines=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def _ffmpeg_has_encoder(name: str) -> bool:
+    """Check whether the installed FFmpeg was built with the given encoder"""
+    return any(line.split()[1:2] == [name] for line in _ffmpeg_encoders().splitlines())
+
+
+# Warm browsers kept between renders: a cold Chrome launch costs 0.5-2s per worker
+_DRIVER_POOL = queue.Queue(maxsize=4)
+
+
+def _acquire_driver(chrome_options: Options) -> Tuple[webdriver.Chrome, bool]:
+    """Return (driver, reused): a pooled browser that still responds, or a newly launched one"""
+    while True:
+        try:
+            driver = _DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            return webdriver.Chrome(options=chrome_options), False
+        try:
+            driver.execute_script("return 1;")
+            return driver, True
+        except Exception:
+            _quit_driver(driver)
+
+
+def _release_driver(driver, script_ids=()):
+    """Reset a browser after a render and return it to the pool; quit it if that fails or the pool is full"""
+    try:
+        for script_id in script_ids:
+            driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script_id})
+        driver.get("about:blank")
+        driver.execute_cdp_cmd("Emulation.clearDeviceMetricsOverride", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        # Every upload loads from file://, so storage left by one creative would be seen by the next
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": "file://", "storageTypes": "all"})
+        _DRIVER_POOL.put_nowait(driver)
+    except Exception:
+        _quit_driver(driver)
+
+
+def _quit_driver(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+@atexit.register
+def _drain_driver_pool():
+    while True:
+        try:
+            driver = _DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            return
+        _quit_driver(driver)
+
+
+# Fewest frames an automatically added render worker must get
+_MIN_FRAMES_PER_WORKER = 150
+
+# Hardware encoders that can stand in for each software codec, in order of preference
+_HW_ENCODERS = {
+    "libx264": ("h264_nvenc", "h264_videotoolbox", "h264_qsv"),
+    "libx265": ("hevc_nvenc", "hevc_videotoolbox", "hevc_qsv"),
+}
+
+# x264 preset names mapped onto NVENC's p1 (fastest) .. p7 (best) scale
+_NVENC_PRESETS = {
+    "ultrafast": "p1", "superfast": "p2", "veryfast": "p3", "faster": "p4", "fast": "p4",
+    "medium": "p5", "slow": "p6", "slower": "p7", "veryslow": "p7",
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _encoder_works(output_args: tuple) -> bool:
+    """
+    Whether FFmpeg can encode a test frame with the given output arguments.
+    Builds often list NVENC/QSV without a usable device, and a device may reject
+    particular options, so a hardware encoder is only chosen after it encodes
+    a frame with the exact arguments the render will use.
+    """
+    test_cmd = ["ffmpeg", "-hide_banner", "-loglevel", "error", "-f", "lavfi",
+                "-i", "color=black:s=256x256:d=0.1", "-frames:v", "1", *output_args, "-f", "null", "-"]
+    try:
+        return subprocess.run(test_cmd, capture_output=True, timeout=15).returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+def _extract_zip_members(zip_path: str, infos: list, extract_dir: str):
+    """
+    Extract the given members of zip_path into extract_dir on a thread pool.
+    zlib inflation and file writes release the GIL; each thread reads through its
+    own ZipFile handle because a ZipFile's file position is shared state.
+    """
+    num_threads = min(8, os.cpu_count() or 1, len(infos))
+    if num_threads <= 1:
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            zip_ref.extractall(extract_dir, members=infos)
+        return
+
+    # Create the directory tree up front; concurrent makedirs calls inside ZipFile.extract would race
+    for info in infos:
+        member_path = os.path.join(extract_dir, os.path.normpath(info.filename))
+        os.makedirs(member_path if info.is_dir() else os.path.dirname(member_path), exist_ok=True)
+
+    local = threading.local()
+    handles = []
+
+    def extract(info):
+        zip_ref = getattr(local, 'zip_ref', None)
+        if zip_ref is None:
+            zip_ref = local.zip_ref = zipfile.ZipFile(zip_path, 'r')
+            handles.append(zip_ref)
+        zip_ref.extract(info, extract_dir)
+
+    try:
+        with ThreadPoolExecutor(max_workers=num_threads) as pool:
+            list(pool.map(extract, [info for info in infos if not info.is_dir()]))
+    finally:
+        for zip_ref in handles:
+            zip_ref.close()
+
+
 class HTML5ToVideoConverter:
     """Main converter class"""
 
@@ -294,8 +937,7 @@ class HTML5ToVideoConverter:
         self.cancelled = False
         self.progress_callback = progress_callback
         self.debug_log = []  # Collect all debug output
-        import datetime
-        self.start_time = datetime.datetime.now()
+        self._t0 = time.perf_counter()
 
     def update_progress(self, value, message=None):
         """Update external progress if callback provided"""
@@ -303,10 +945,8 @@ class HTML5ToVideoConverter:
             self.progress_callback(value, message)
 
     def log(self, message):
-        """Add message to debug log"""
-        import datetime
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        log_entry = f"[{timestamp}] {message}"
+        """Add message to debug log, stamped with seconds since the converter was created"""
+        log_entry = f"[{time.perf_counter() - self._t0:7.3f}s] {message}"
         self.debug_log.append(log_entry)
         return log_entry
 
@@ -316,9 +956,7 @@ class HTML5ToVideoConverter:
 
     def _get_elapsed_time(self):
         """Get elapsed time since conversion started"""
-        import datetime
-        elapsed = datetime.datetime.now() - self.start_time
-        return f"{elapsed.total_seconds():.2f}s"
+        return f"{time.perf_counter() - self._t0:.2f}s"
 
     def extract_zip(self, zip_path: str, extract_dir: str) -> str:
         """Extract and find main HTML file"""
@@ -328,72 +966,83 @@ class HTML5ToVideoConverter:
         self.log(f"Extract to: {extract_dir}")
 
         with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            files = zip_ref.namelist()
+            infos = zip_ref.infolist()
+            file_count = len(infos)
 
             # Validate empty ZIP
-            if len(files) == 0:
+            if file_count == 0:
                 self.log("ERROR: ZIP file is empty")
                 raise ValueError("ZIP file is empty")
 
             # Validate file count (prevent excessive files)
-            if len(files) > 1000:
-                self.log(f"ERROR: ZIP contains too many files ({len(files)})")
-                raise ValueError(f"ZIP contains too many files ({len(files)}). Maximum 1000 files allowed.")
+            if file_count > 1000:
+                self.log(f"ERROR: ZIP contains too many files ({file_count})")
+                raise ValueError(f"ZIP contains too many files ({file_count}). Maximum 1000 files allowed.")
 
-            # Calculate total uncompressed size (prevent ZIP bombs)
-            total_size = sum(info.file_size for info in zip_ref.infolist())
+            # Single pass over the central directory: running uncompressed size
+            # (prevent ZIP bombs, stop as soon as the budget is exceeded) and
+            # path safety (prevent path traversal)
             max_uncompressed = 50 * 1024 * 1024  # 50MB uncompressed
+            total_size = 0
+            normpath = os.path.normpath
+            isabs = os.path.isabs
+            for info in infos:
+                total_size += info.file_size
+                if total_size > max_uncompressed:
+                    size_mb = total_size / (1024 * 1024)
+                    self.log(f"ERROR: Uncompressed size too large ({size_mb:.1f} MB)")
+                    raise ValueError(f"Uncompressed size too large ({size_mb:.1f} MB). Maximum 50 MB allowed.")
 
-            if total_size > max_uncompressed:
-                size_mb = total_size / (1024 * 1024)
-                self.log(f"ERROR: Uncompressed size too large ({size_mb:.1f} MB)")
-                raise ValueError(f"Uncompressed size too large ({size_mb:.1f} MB). Maximum 50 MB allowed.")
-
-            self.log(f"ZIP contains {len(files)} files")
-            self.log(f"Total uncompressed size: {total_size / (1024 * 1024):.1f} MB")
-
-            # Validate all paths for security (prevent path traversal)
-            for file in files:
                 # Normalize path and check for traversal attempts
-                normalized = os.path.normpath(file)
-                if normalized.startswith('..') or os.path.isabs(normalized):
-                    self.log(f"ERROR: Unsafe file path detected: {file}")
-                    raise ValueError(f"Unsafe file path in ZIP: {file}")
+                normalized = normpath(info.filename)
+                if normalized.startswith('..') or isabs(normalized):
+                    self.log(f"ERROR: Unsafe file path detected: {info.filename}")
+                    raise ValueError(f"Unsafe file path in ZIP: {info.filename}")
 
-            # Safe to extract now
-            zip_ref.extractall(extract_dir)
-            self.log(f"Extracted all files successfully")
+            self.log(f"ZIP contains {file_count} files")
+            self.log(f"Total uncompressed size: {total_size / (1024 * 1024):.1f} MB")
 
-        html_files = list(Path(extract_dir).rglob("*.html"))
-        self.log(f"Found {len(html_files)} HTML files")
+        # Look for index.html or use the shallowest HTML file (the same page analyze_zip reads)
+        main_member = _find_main_html_member(info.filename for info in infos)
 
-        if not html_files:
+        if not main_member:
             self.log("ERROR: No HTML files found in archive")
             raise FileNotFoundError("No HTML files found in the archive")
 
-        # Look for index.html or use first HTML file
-        main_html = None
-        for html_file in html_files:
-            self.log(f"  - {html_file.name}")
-            if html_file.name.lower() in ['index.html', 'index.htm']:
-                main_html = html_file
-                break
-
-        if not main_html:
-            main_html = html_files[0]
+        # Safe to extract now (reuse the validated member list)
+        _extract_zip_members(zip_path, infos, extract_dir)
+        self.log(f"Extracted all files successfully")
 
-        self.log(f"Using main HTML: {main_html.name}")
-        self.log(f"Absolute path: {main_html.absolute()}")
-        return str(main_html.absolute())
+        main_html = os.path.abspath(os.path.join(extract_dir, os.path.normpath(main_member)))
+        self.log(f"Using main HTML: {os.path.basename(main_html)}")
+        self.log(f"Absolute path: {main_html}")
+        return main_html
 
-    def render_html_to_frames(self, html_path: str, output_dir: str, config: VideoConfig) -> Optional[str]:
-        """Render HTML to frames with guaranteed correct dimensions"""
-        from PIL import Image
+    def render_html_to_video(self, html_path: str, work_dir: str, output_path: str, config: VideoConfig,
+                             fallback: bool = False) -> bool:
+        """Render HTML frames with guaranteed correct dimensions and stream them into FFmpeg
 
+        Screenshots are piped straight into FFmpeg's stdin; no frame is written to disk.
+        With fallback=True the encoder uses baseline H.264 settings for maximum compatibility;
+        settings that fail a one-frame FFmpeg probe switch to them before capture starts.
+        """
         self.update_progress(0.2, "Loading browser...")
 
-        frames_dir = os.path.join(output_dir, "frames")
-        os.makedirs(frames_dir, exist_ok=True)
+        if config.codec == "libsvtav1" and not _ffmpeg_has_encoder("libsvtav1"):
+            self.log("WARNING: FFmpeg has no libsvtav1 encoder, using libx264")
+            config = replace(config, codec="libx264")
+        if config.codec in _HW_ENCODERS and config.hardware_encoding and not fallback:
+            for name in _HW_ENCODERS[config.codec]:
+                candidate = replace(config, codec=name)
+                if _ffmpeg_has_encoder(name) and _encoder_works(tuple(self._ffmpeg_output_args(candidate))):
+                    self.log(f"Using hardware encoder: {name}")
+                    config = candidate
+                    break
+        # Settle on working encoder settings before any capture: an encoder that fails
+        # mid-render would otherwise mean rendering the whole animation in Chrome again
+        if not fallback and not _encoder_works(tuple(self._ffmpeg_output_args(config))):
+            self.log(f"WARNING: FFmpeg cannot encode with the {config.codec} settings, using baseline H.264 parameters")
+            fallback = True
 
         total_frames = config.fps * config.duration
         frame_time_s = 1.0 / config.fps
@@ -448,9 +1097,18 @@ class HTML5ToVideoConverter:
         chrome_options.add_argument('--headless=new')
         chrome_options.add_argument('--no-sandbox')
         chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
+        # Let Chrome rasterize on the GPU when one is available (it falls back to software otherwise)
+        chrome_options.add_argument('--enable-gpu-rasterization')
+        chrome_options.add_argument('--enable-zero-copy')
+        chrome_options.add_argument('--ignore-gpu-blocklist')
+        # Keep timers and rendering at full rate in a window that is never focused
+        chrome_options.add_argument('--disable-background-timer-throttling')
+        chrome_options.add_argument('--disable-renderer-backgrounding')
+        chrome_options.add_argument('--disable-backgrounding-occluded-windows')
         chrome_options.add_argument('--hide-scrollbars')
         chrome_options.add_argument('--disable-blink-features=AutomationControlled')
+        # Console output is never read back; don't let chromedriver buffer it
+        chrome_options.set_capability('goog:loggingPrefs', {'browser': 'OFF'})
 
         # Set window to TARGET resolution (where we'll render centered content)
         # We'll use CSS transform to scale content proportionally and center it
@@ -461,98 +1119,299 @@ class HTML5ToVideoConverter:
         self.log(f"Will use CSS transform for proportional scaling")
 
         # Find browser binary
-        browser_paths = [
-            "/Applications/Comet.app/Contents/MacOS/Comet",  # macOS
-            "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",  # macOS
-            "/Applications/Chromium.app/Contents/MacOS/Chromium",  # macOS
-            "/usr/bin/chromium",  # Linux
-            "/usr/bin/chromium-browser",  # Linux
-            "/usr/bin/google-chrome",  # Linux
-            "/usr/bin/google-chrome-stable",  # Linux
-            "/snap/bin/chromium",  # Linux snap
-            "chromium",  # PATH fallback
-            "chromium-browser",  # PATH fallback
+        browser_found = _find_browser_binary()
+        if browser_found:
+            chrome_options.binary_location = browser_found
+            self.log(f"Found browser: {browser_found}")
+        else:
+            self.log("WARNING: No browser binary found in common paths, using system default")
+            self.log(f"Searched paths: {', '.join(_BROWSER_PATHS)}")
+
+        # Split the timeline into contiguous ranges, one headless browser and encoder per range.
+        # Script state (timers, promise chains, rAF loops) builds up frame by frame, so a worker
+        # replays the seeks before its range un-captured; with a shared clock epoch and seeded
+        # Math.random every page then reaches its first frame in the same state.
+        # Auto mode only splits clips long enough to repay each extra browser's page setup and the join
+        num_workers = config.render_workers or max(1, min(4, (os.cpu_count() or 1) // 2,
+                                                          total_frames // _MIN_FRAMES_PER_WORKER))
+        num_workers = max(1, min(num_workers, total_frames))
+        bounds = [total_frames * i // num_workers for i in range(num_workers + 1)]
+        layout = {
+            'target_width': target_width, 'target_height': target_height, 'format_name': format_name,
+            'scaled_width': scaled_width, 'scaled_height': scaled_height,
+            'scale_factor': scale_factor, 'pad_x': pad_x, 'pad_y': pad_y,
+            'needs_format_change': needs_format_change,
+            'clock_epoch_ms': int(time.time() * 1000),
+            # Parallel encoders share the cores instead of each sizing its thread pool to the whole machine
+            'encoder_threads': max(1, (os.cpu_count() or 1) // num_workers),
+        }
+        self.log(f"Render workers: {num_workers} (frames per worker: ~{total_frames // num_workers})")
+        self.log(f"Encoder threads per worker: {layout['encoder_threads']}")
+
+        # A single worker encodes straight to the output; several encode segments that are joined losslessly
+        if num_workers == 1:
+            segment_paths = [output_path]
+        else:
+            extension = os.path.splitext(output_path)[1] or ".mp4"
+            segment_paths = [os.path.join(work_dir, f"segment_{i:02d}{extension}") for i in range(num_workers)]
+
+        self.log(f"=== VIDEO ENCODING ===")
+        self.log(f"Output path: {output_path}")
+        self.log(f"Encoder arguments: {' '.join(self._ffmpeg_output_args(config, fallback))}")
+
+        frames_done = [0] * num_workers
+        abort = threading.Event()
+        self.update_progress(0.3, "Capturing frames...")
+        with ThreadPoolExecutor(max_workers=num_workers) as pool:
+            pending = {
+                pool.submit(self._render_frame_range, html_path, work_dir, segment_paths[i], config, layout,
+                            chrome_options, bounds[i], bounds[i + 1], frames_done, i, abort, fallback)
+                for i in range(num_workers)
+            }
+            # Progress is reported from this thread; UI callbacks are not thread-safe
+            while pending:
+                finished, pending = wait(pending, timeout=0.25)
+                if any(not future.result() for future in finished):
+                    abort.set()
+                captured = sum(frames_done)
+                if captured:
+                    self.update_progress(0.3 + (0.6 * captured / total_frames), f"Frame {captured}/{total_frames}")
+
+        if abort.is_set() or self.cancelled:
+            return False
+
+        self.log(f"=== FRAME CAPTURE COMPLETE ===")
+        self.log(f"Total frames captured and encoded: {total_frames}")
+        self.log(f"Frames at target dimensions: {target_width}x{target_height}")
+        self.log(f"Proportional scaling applied: {scale_factor:.2f}x (no stretching)")
+
+        if num_workers > 1:
+            self.update_progress(0.95, "Joining video segments...")
+            if not self._join_segments(segment_paths, output_path, work_dir):
+                return False
+
+        self.log("=== ENCODING SUCCESS ===")
+        return True
+
+    def _ffmpeg_output_args(self, config: VideoConfig, fallback: bool = False) -> list:
+        """Codec, pixel format and rate arguments for the output video"""
+        if fallback:
+            # Minimal parameters with the most widely supported H.264 profile
+            return ["-c:v", "libx264", "-pix_fmt", "yuv420p", "-profile:v", "baseline", "-level", "3.0",
+                    "-r", str(config.fps)]
+
+        # Calculate effective output FPS based on animation speed
+        # If animation_speed = 0.85, we want video to play 15% slower
+        # So output FPS should be 85% of capture FPS (60 * 0.85 = 51 FPS)
+        output_fps = config.fps * config.animation_speed
+
+        if config.codec == "libsvtav1":
+            # SVT-AV1 uses its own preset/CRF scales; preset 8 at CRF 32 is comparable to x264 slow/18
+            return ["-c:v", "libsvtav1", "-pix_fmt", "yuv420p10le", "-r", str(output_fps),
+                    "-preset", "8", "-crf", "32", "-svtav1-params", "tune=0:enable-overlays=1"]
+
+        # Hardware encoders take their own preset/quality options
+        if config.codec.endswith("_nvenc"):
+            return ["-c:v", config.codec, "-pix_fmt", "yuv420p", "-r", str(output_fps),
+                    "-preset", _NVENC_PRESETS.get(config.preset, "p4"), "-rc", "vbr", "-cq", str(config.crf), "-b:v", "0"]
+        if config.codec.endswith("_videotoolbox"):
+            return ["-c:v", config.codec, "-pix_fmt", "yuv420p", "-r", str(output_fps),
+                    "-q:v", str(max(1, min(100, 100 - 2 * config.crf))), "-realtime", "0"]
+        if config.codec.endswith("_qsv"):
+            qsv_preset = config.preset if config.preset not in ("ultrafast", "superfast") else "veryfast"
+            return ["-c:v", config.codec, "-pix_fmt", "nv12", "-r", str(output_fps),
+                    "-preset", qsv_preset, "-global_quality", str(config.crf)]
+
+        args = [
+            "-c:v", config.codec,
+            "-pix_fmt", "yuv420p",
+            "-r", str(output_fps),  # Output framerate for playback speed control
         ]
 
-        browser_found = None
-        for path in browser_paths:
-            if os.path.exists(path):
-                chrome_options.binary_location = path
-                browser_found = path
-                self.log(f"Found browser: {path}")
+        # Add codec-specific settings - keep it SIMPLE for cloud compatibility
+        if config.codec in ["libx264", "libx265"]:
+            # Use CRF for quality control
+            args.extend(["-crf", str(config.crf), "-preset", config.preset])
+            if config.codec == "libx264" and config.tune:
+                args.extend(["-tune", config.tune])
+        elif config.codec == "libvpx-vp9":
+            args.extend(["-b:v", config.bitrate, "-crf", str(config.crf)])
+        else:
+            # For other codecs, use simple bitrate
+            args.extend(["-b:v", config.bitrate])
+        return args
+
+    def _start_encoder(self, segment_path: str, stderr_path: str, config: VideoConfig, frame_size: tuple,
+                       target_size: tuple, fallback: bool, faststart: bool, threads: int) -> subprocess.Popen:
+        """Start an FFmpeg process that reads encoded screenshots (PNG/JPEG) from stdin"""
+        frame_w, frame_h = frame_size
+        # Even dimensions for yuv420p; scale only when the capture doesn't match the target frame
+        target_w, target_h = target_size[0] & ~1, target_size[1] & ~1
+        if (frame_w, frame_h) != (target_w, target_h):
+            video_filter = f"scale={target_w}:{target_h}:flags=lanczos,unsharp=5:5:1.0:5:5:0.0"
+        else:
+            video_filter = "unsharp=5:5:1.0:5:5:0.0"
+
+        ffmpeg_cmd = [
+            "ffmpeg",
+            "-y",  # Overwrite output
+            "-filter_threads", str(threads),  # Threads for the scale/unsharp chain
+            "-f", "image2pipe",
+            "-framerate", str(config.fps),  # Input: how fast frames were captured
+            "-i", "-",
+            "-vf", video_filter,
+        ]
+        ffmpeg_cmd.extend(self._ffmpeg_output_args(config, fallback))
+        ffmpeg_cmd.extend(["-threads", str(threads)])  # Encoder threads
+        if faststart:
+            ffmpeg_cmd.extend(["-movflags", "+faststart"])  # Web compatibility
+        ffmpeg_cmd.append(segment_path)
+
+        # FFmpeg's log goes to a file so a full stderr pipe can never stall the encoder
+        with open(stderr_path, 'wb') as stderr_file:
+            return subprocess.Popen(ffmpeg_cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                    stderr=stderr_file, bufsize=1024 * 1024)
+
+    @staticmethod
+    def _abort_encoder(encoder: Optional[subprocess.Popen], writer: ThreadPoolExecutor):
+        """Kill and reap an unfinished encoder, let the writer thread drain, then close the pipe"""
+        if encoder is not None:
+            encoder.kill()
+            encoder.wait()
+        writer.shutdown()  # a write in flight fails fast once FFmpeg is gone
+        if encoder is not None:
+            try:
+                encoder.stdin.close()
+            except OSError:
+                pass  # buffered frame data has nowhere to go
+
+    def _finish_encoder(self, encoder: subprocess.Popen, stderr_path: str, verbose: bool) -> bool:
+        """Close the encoder's input, wait for it to exit and log its output"""
+        try:
+            encoder.stdin.close()
+        except BrokenPipeError:
+            pass
+        # Block in the OS until FFmpeg exits, waking every 0.1s only to honour a cancel
+        while True:
+            try:
+                encoder.wait(timeout=0.1)
                 break
+            except subprocess.TimeoutExpired:
+                if self.cancelled:
+                    encoder.kill()
+                    encoder.wait()
+                    self.log("Encoding cancelled")
+                    return False
+        with open(stderr_path, 'r', errors='replace') as f:
+            output = f.read().strip()
+
+        # One log entry for the whole buffer rather than one per line
+        if encoder.returncode == 0:
+            if verbose:
+                self.log(f"=== FFMPEG OUTPUT ===\n{output}")
+            return True
+
+        self.log(f"=== FFMPEG ERROR ===")
+        self.log(f"Exit code: {encoder.returncode}")
+        self.log(f"STDERR output:\n{output}")
+        return False
+
+    def _join_segments(self, segment_paths: list, output_path: str, work_dir: str) -> bool:
+        """Concatenate encoded segments into the output without re-encoding"""
+        list_path = os.path.join(work_dir, "segments.txt")
+        with open(list_path, 'w') as f:
+            for path in segment_paths:
+                escaped = path.replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+
+        ffmpeg_cmd = ["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", list_path,
+                      "-c", "copy", "-movflags", "+faststart", output_path]
+        self.log(f"Joining {len(segment_paths)} segments: {' '.join(ffmpeg_cmd)}")
+        result = subprocess.run(ffmpeg_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                universal_newlines=True)
+        if result.returncode != 0:
+            self.log(f"=== SEGMENT JOIN ERROR ===")
+            self.log(f"Exit code: {result.returncode}")
+            self.log(result.stderr.strip())
+            return False
+        self.log("Segments joined")
+        return True
 
-        if not browser_found:
-            self.log("WARNING: No browser binary found in common paths, using system default")
-            self.log(f"Searched paths: {', '.join(browser_paths)}")
+    def _render_frame_range(self, html_path: str, work_dir: str, segment_path: str, config: VideoConfig,
+                            layout: dict, chrome_options: Options, start_frame: int, end_frame: int,
+                            frames_done: list, worker_index: int, abort: threading.Event, fallback: bool) -> bool:
+        """Capture frames [start_frame, end_frame) in a dedicated headless browser and encode them to segment_path
+
+        Each worker loads and prepares its own page, so ranges can be rendered concurrently.
+        Only the first worker writes the detailed setup log; errors are always logged.
+        """
+        log = self.log if start_frame == 0 else (lambda message: None)
+        target_width, target_height = layout['target_width'], layout['target_height']
+        format_name = layout['format_name']
+        scaled_width, scaled_height = layout['scaled_width'], layout['scaled_height']
+        scale_factor = layout['scale_factor']
+        pad_x, pad_y = layout['pad_x'], layout['pad_y']
+        needs_format_change = layout['needs_format_change']
+        total_frames = config.fps * config.duration
+        frame_time_s = 1.0 / config.fps
+        stderr_path = os.path.join(work_dir, f"ffmpeg_{worker_index:02d}.log")
+        screenshot_params = _screenshot_params(config)
+        encoder = None
+        script_ids = []
+        writer = ThreadPoolExecutor(max_workers=1)  # keeps frame writes in order
+        pending_write = None
 
         try:
-            self.log("Creating WebDriver instance...")
-            driver = webdriver.Chrome(options=chrome_options)
-            self.log("WebDriver created successfully")
+            log("Acquiring WebDriver instance...")
+            driver, reused = _acquire_driver(chrome_options)
+            log("Reusing warm browser from pool" if reused else "WebDriver created successfully")
 
             # Set timeouts to prevent hanging
             driver.set_page_load_timeout(30)  # 30 second page load timeout
             driver.set_script_timeout(10)     # 10 second script execution timeout
-            self.log("Timeouts set: 30s page load, 10s script execution")
+            log("Timeouts set: 30s page load, 10s script execution")
         except Exception as e:
             self.log(f"ERROR: Failed to create WebDriver: {e}")
-            return None
+            return False
 
         try:
             # Set window to TARGET resolution via Selenium
-            self.log(f"=== PAGE LOADING ===")
+            log(f"=== PAGE LOADING ===")
             driver.set_window_size(target_width, target_height)
-            self.log(f"Selenium set_window_size called: {target_width}x{target_height} (target frame)")
+            log(f"Selenium set_window_size called: {target_width}x{target_height} (target frame)")
+
+            # Pin the viewport itself to the target frame, independent of any window chrome
+            driver.execute_cdp_cmd("Emulation.setDeviceMetricsOverride", {
+                "width": target_width, "height": target_height, "deviceScaleFactor": 1, "mobile": False,
+            })
+            log(f"Viewport pinned to {target_width}x{target_height} via Emulation.setDeviceMetricsOverride")
+
+            # Drive page time from our own clock instead of the wall clock
+            # (removed again before the browser goes back to the pool)
+            clock_js = f"window.__clockEpoch = {layout['clock_epoch_ms']};{_VIRTUAL_CLOCK_JS}"
+            for script in (clock_js, _PAGE_HELPERS_JS):
+                result = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": script})
+                script_ids.append(result["identifier"])
 
             # Load HTML
             file_url = f"file://{html_path}"
-            self.log(f"Loading URL: {file_url}")
+            log(f"Loading URL: {file_url}")
             driver.get(file_url)
-            self.log(f"Page loaded")
+            log(f"Page loaded")
 
             # Extract background color and apply minimal CSS for high-res rendering
             bg_color_hex = "#000000"  # default
             if needs_format_change:
-                self.log(f"=== HIGH-RESOLUTION RENDERING SETUP ===")
-                self.log(f"Target format: {format_name}")
+                log(f"=== HIGH-RESOLUTION RENDERING SETUP ===")
+                log(f"Target format: {format_name}")
 
                 # Extract predominant background color from page
                 try:
-                    bg_color_js = """
-                        function getPredominantColor() {
-                            // Try body background color first
-                            let bodyBg = window.getComputedStyle(document.body).backgroundColor;
-                            if (bodyBg && bodyBg !== 'rgba(0, 0, 0, 0)' && bodyBg !== 'transparent') {
-                                return bodyBg;
-                            }
-
-                            // Try html background color
-                            let htmlBg = window.getComputedStyle(document.documentElement).backgroundColor;
-                            if (htmlBg && htmlBg !== 'rgba(0, 0, 0, 0)' && htmlBg !== 'transparent') {
-                                return htmlBg;
-                            }
-
-                            // Try first div or main content container
-                            let containers = document.querySelectorAll('div, main, section, #banner, .frame');
-                            for (let el of containers) {
-                                let bg = window.getComputedStyle(el).backgroundColor;
-                                if (bg && bg !== 'rgba(0, 0, 0, 0)' && bg !== 'transparent') {
-                                    return bg;
-                                }
-                            }
-
-                            // Default to black
-                            return 'rgb(0, 0, 0)';
-                        }
-                        return getPredominantColor();
-                    """
-                    bg_color_rgb = driver.execute_script(bg_color_js)
+                    bg_color_rgb = driver.execute_script("return window.__getBg();")
 
                     # Convert RGB to hex
                     if bg_color_rgb and bg_color_rgb.startswith('rgb'):
-                        import re
-                        rgb_match = re.search(r'(\d+),\s*(\d+),\s*(\d+)', bg_color_rgb)
+                        rgb_match = _BG_RGB_RE.search(bg_color_rgb)
                         if rgb_match:
                             r, g, b = map(int, rgb_match.groups())
                             bg_color_hex = f"#{r:02x}{g:02x}{b:02x}"
@@ -561,19 +1420,19 @@ class HTML5ToVideoConverter:
                     else:
                         bg_color_hex = bg_color_rgb if bg_color_rgb else "#000000"
 
-                    self.log(f"Detected background color: {bg_color_rgb} → {bg_color_hex}")
+                    log(f"Detected background color: {bg_color_rgb} → {bg_color_hex}")
                 except Exception as e:
-                    self.log(f"Could not detect background color, using black: {e}")
+                    log(f"Could not detect background color, using black: {e}")
                     bg_color_hex = "#000000"
 
                 # Log proportional scaling strategy
-                self.log(f"=== PROPORTIONAL SCALING STRATEGY ===")
-                self.log(f"Browser viewport: {target_width}x{target_height} (target frame)")
-                self.log(f"Source content: {config.width}x{config.height}")
-                self.log(f"Proportional scale: {scale_factor:.3f}x (uniform)")
-                self.log(f"Scaled content: {scaled_width}x{scaled_height}")
-                self.log(f"Centering with padding: {pad_x}px H, {pad_y}px V")
-                self.log(f"Background color: {bg_color_hex}")
+                log(f"=== PROPORTIONAL SCALING STRATEGY ===")
+                log(f"Browser viewport: {target_width}x{target_height} (target frame)")
+                log(f"Source content: {config.width}x{config.height}")
+                log(f"Proportional scale: {scale_factor:.3f}x (uniform)")
+                log(f"Scaled content: {scaled_width}x{scaled_height}")
+                log(f"Centering with padding: {pad_x}px H, {pad_y}px V")
+                log(f"Background color: {bg_color_hex}")
 
                 # PROPORTIONAL CSS transform scaling with FORCED viewport dimensions
                 proportional_scaling = f"""
@@ -650,10 +1509,10 @@ class HTML5ToVideoConverter:
                     console.log('Result: {scaled_width}x{scaled_height} centered in {target_width}x{target_height} frame');
                 """
                 driver.execute_script(proportional_scaling)
-                self.log(f"Applied PROPORTIONAL scaling with FORCED viewport dimensions")
+                log(f"Applied PROPORTIONAL scaling with FORCED viewport dimensions")
             else:
                 # No format change needed - use original dimensions
-                self.log(f"=== STANDARD RENDERING ===")
+                log(f"=== STANDARD RENDERING ===")
                 js_standard = f"""
                     document.documentElement.style.margin = '0';
                     document.documentElement.style.padding = '0';
@@ -664,364 +1523,194 @@ class HTML5ToVideoConverter:
                     document.body.style.overflow = 'hidden';
                 """
                 driver.execute_script(js_standard)
-                self.log(f"Using standard rendering at {config.width}x{config.height}")
+                log(f"Using standard rendering at {config.width}x{config.height}")
 
-            # REQUIREMENT #4: Delay for page to settle
-            self.log("Waiting 1.5s for page to settle...")
-            time.sleep(1.5)
-            self.log("Wait complete")
+            # REQUIREMENT #4: Delay for page to settle - wait for the first full paint,
+            # then give page scripts 1.5s of virtual time without waiting it out
+            log("Waiting for first paint, advancing page clock 1.5s for page to settle...")
+            settle_start = time.perf_counter()
+            driver.execute_async_script(_AWAIT_PAINT_JS)
+            driver.execute_async_script(
+                "window.__advanceClockInTasks(1500).then(arguments[arguments.length - 1]);")
+            log(f"Wait complete ({time.perf_counter() - settle_start:.3f}s)")
 
             # REQUIREMENT #5: Log detected, requested, and actual dimensions
-            actual_viewport_w = driver.execute_script("return window.innerWidth;")
-            actual_viewport_h = driver.execute_script("return window.innerHeight;")
-            actual_body_w = driver.execute_script("return document.body.offsetWidth;")
-            actual_body_h = driver.execute_script("return document.body.offsetHeight;")
+            actual_viewport_w, actual_viewport_h, actual_body_w, actual_body_h = driver.execute_script(
+                "return window.__getDims();")
 
             # Log dimension analysis
-            self.log(f"=== DIMENSION ANALYSIS ===")
-            self.log(f"Native HTML5 size: {config.width}x{config.height}")
-            self.log(f"Target output size: {target_width}x{target_height}")
-            self.log(f"Actual viewport: {actual_viewport_w}x{actual_viewport_h}")
-            self.log(f"Actual body: {actual_body_w}x{actual_body_h}")
+            log(f"=== DIMENSION ANALYSIS ===")
+            log(f"Native HTML5 size: {config.width}x{config.height}")
+            log(f"Target output size: {target_width}x{target_height}")
+            log(f"Actual viewport: {actual_viewport_w}x{actual_viewport_h}")
+            log(f"Actual body: {actual_body_w}x{actual_body_h}")
 
             if needs_format_change:
                 hires_match = 'YES' if actual_viewport_w == target_width and actual_viewport_h == target_height else 'NO'
-                self.log(f"High-res viewport match: {hires_match}")
+                log(f"High-res viewport match: {hires_match}")
                 if actual_viewport_w != target_width or actual_viewport_h != target_height:
-                    self.log(f"WARNING: Viewport mismatch! Expected {target_width}x{target_height}, got {actual_viewport_w}x{actual_viewport_h}")
-                    self.log(f"CORRECTING viewport dimensions...")
-
-                    # CRITICAL FIX: Force viewport to exact dimensions
-                    # Chrome subtracts UI chrome, we need to compensate
-                    height_diff = target_height - actual_viewport_h
-                    width_diff = target_width - actual_viewport_w
-
-                    self.log(f"Height shortfall: {height_diff}px, Width shortfall: {width_diff}px")
-
-                    # Resize window to compensate for Chrome UI
-                    corrected_width = target_width + width_diff
-                    corrected_height = target_height + height_diff
-
-                    self.log(f"Resizing window to: {corrected_width}x{corrected_height} (to achieve {target_width}x{target_height} viewport)")
-                    driver.set_window_size(corrected_width, corrected_height)
-
-                    # Wait for resize
-                    time.sleep(0.5)
-
-                    # Verify correction
-                    new_viewport_w = driver.execute_script("return window.innerWidth;")
-                    new_viewport_h = driver.execute_script("return window.innerHeight;")
-                    self.log(f"After correction: {new_viewport_w}x{new_viewport_h}")
-
-                    if new_viewport_w == target_width and new_viewport_h == target_height:
-                        self.log(f"SUCCESS: Viewport corrected successfully!")
-                    else:
-                        self.log(f"WARNING: Viewport still mismatched, will continue anyway")
+                    log(f"WARNING: Viewport mismatch! Expected {target_width}x{target_height}, got {actual_viewport_w}x{actual_viewport_h}")
+                    log(f"FFmpeg will scale frames to the target size")
             else:
                 native_match = 'YES' if actual_viewport_w == config.width and actual_viewport_h == config.height else 'NO'
-                self.log(f"Native size match: {native_match}")
+                log(f"Native size match: {native_match}")
                 if actual_viewport_w != config.width or actual_viewport_h != config.height:
-                    self.log(f"WARNING: Viewport mismatch! Expected {config.width}x{config.height}, got {actual_viewport_w}x{actual_viewport_h}")
+                    log(f"WARNING: Viewport mismatch! Expected {config.width}x{config.height}, got {actual_viewport_w}x{actual_viewport_h}")
 
             # Trigger animations and prepare for recording
-            self.log(f"=== ANIMATION SETUP ===")
-            self.log("Triggering animations and interactive elements...")
-
-            # Execute JavaScript to start animations and simulate interactions
-            animation_trigger_script = """
-                // Force all CSS animations to run and apply hover states
-                var style = document.createElement('style');
-                style.innerHTML = `
-                    * {
-                        animation-play-state: running !important;
-                        animation-delay: 0s !important;
-                    }
+            log(f"=== ANIMATION SETUP ===")
+            log("Triggering animations and interactive elements...")
 
-                    /* Force hover states to be visible (for interactive demos) */
-                    *:hover,
-                    .amount:hover,
-                    .button:hover {
-                        /* Apply hover styles permanently for demo */
-                    }
-                `;
-                document.head.appendChild(style);
-
-                // Force first interactive element to appear hovered
-                var firstInteractive = document.querySelector('.button, .amount, [class*="hover"]');
-                if (firstInteractive) {
-                    firstInteractive.classList.add('force-hover');
-                    var hoverStyle = document.createElement('style');
-                    hoverStyle.innerHTML = '.force-hover { /* hover styles will be applied */ }';
-                    document.head.appendChild(hoverStyle);
-                }
-
-                // Simulate hover on all interactive elements
-                var interactiveElements = document.querySelectorAll('a, button, [class*="hover"], [class*="interactive"]');
-                interactiveElements.forEach(function(el) {
-                    el.dispatchEvent(new MouseEvent('mouseover', {bubbles: true, cancelable: true}));
-                    el.dispatchEvent(new MouseEvent('mouseenter', {bubbles: true, cancelable: true}));
-                });
-
-                // Click the body to trigger any click-based animations
-                document.body.click();
-                document.body.dispatchEvent(new MouseEvent('mouseover', {bubbles: true}));
-
-                // Trigger common animation start functions
-                if (typeof startAnimation === 'function') startAnimation();
-                if (typeof start === 'function') start();
-                if (typeof init === 'function') init();
-                if (typeof play === 'function') play();
-                if (typeof animate === 'function') animate();
-
-                // CreateJS/EaselJS support (common in HTML5 ads)
-                if (typeof createjs !== 'undefined' && createjs.Ticker) {
-                    console.log('CreateJS detected, setting up ticker');
-                    window.__createJSActive = true;
-                    if (!createjs.Ticker.hasEventListener('tick')) {
-                        console.log('CreateJS ticker not started, starting now');
-                        createjs.Ticker.framerate = 30;
-                        createjs.Ticker.timingMode = createjs.Ticker.RAF;
-                    }
-                }
+            # Trigger, inspect and pause animations in one async script (a single round trip)
+            report = driver.execute_async_script(_ANIMATION_SETUP_JS)
+            if report.get('error'):
+                raise RuntimeError(f"Animation setup failed: {report['error']}")
 
-                // GSAP support
-                if (typeof gsap !== 'undefined') {
-                    console.log('GSAP detected');
-                    window.__gsapActive = true;
-                }
-
-                // For canvas/WebGL animations
-                window.animationStartTime = Date.now();
-                window.animationEnabled = true;
-
-                // Trigger any paused videos
-                var videos = document.getElementsByTagName('video');
-                for (var i = 0; i < videos.length; i++) {
-                    videos[i].play();
-                }
+            # Detection messages from the setup script
+            for message in report['messages']:
+                if 'CreateJS' in message or 'GSAP' in message or 'canvas' in message.lower():
+                    log(f"Browser console: {message}")
 
-                // Look for canvas elements and try to find their animation context
-                var canvases = document.getElementsByTagName('canvas');
-                console.log('Found ' + canvases.length + ' canvas elements');
-                for (var i = 0; i < canvases.length; i++) {
-                    console.log('Canvas ' + i + ': ' + canvases[i].width + 'x' + canvases[i].height);
-                }
-            """
-            driver.execute_script(animation_trigger_script)
-            time.sleep(0.5)  # Give animations time to initialize
-
-            # Capture console logs to see what was detected
-            logs = driver.get_log('browser')
-            for log in logs:
-                if 'CreateJS' in log['message'] or 'GSAP' in log['message'] or 'canvas' in log['message'].lower():
-                    self.log(f"Browser console: {log['message']}")
-
-            # Check what CSS animations exist
-            animations_info = driver.execute_script("""
-                var info = {
-                    stylesheets: document.styleSheets.length,
-                    animations: []
-                };
-
-                // Try to find @keyframes rules
-                try {
-                    for (var i = 0; i < document.styleSheets.length; i++) {
-                        var sheet = document.styleSheets[i];
-                        try {
-                            var rules = sheet.cssRules || sheet.rules;
-                            for (var j = 0; j < rules.length; j++) {
-                                if (rules[j].type === CSSRule.KEYFRAMES_RULE) {
-                                    info.animations.push(rules[j].name);
-                                }
-                            }
-                        } catch(e) {
-                            // CORS or access issues
-                        }
-                    }
-                } catch(e) {}
-
-                // Check computed styles on elements
-                var elements = document.querySelectorAll('*');
-                info.animated_elements = 0;
-                for (var i = 0; i < elements.length; i++) {
-                    var style = window.getComputedStyle(elements[i]);
-                    if (style.animationName && style.animationName !== 'none') {
-                        info.animated_elements++;
-                    }
-                }
-
-                return info;
-            """)
-
-            self.log(f"CSS info: {animations_info['stylesheets']} stylesheets, {len(animations_info['animations'])} keyframe animations")
+            animations_info = report['info']
+            log(f"CSS info: {animations_info['stylesheets']} stylesheets, {len(animations_info['animations'])} keyframe animations")
             if animations_info['animations']:
-                self.log(f"Keyframes found: {', '.join(animations_info['animations'])}")
-            self.log(f"Elements with animations: {animations_info['animated_elements']}")
-
-            self.log("Animations triggered")
-
-            # Let animations run briefly to establish initial random states
-            time.sleep(0.1)
-            self.log("Allowed 0.1s for animations to initialize")
-
-            # Now pause and take control using Web Animations API for better control
-            driver.execute_script("""
-                // Store all CSS animations using Web Animations API
-                window.__animationElements = [];
-
-                document.querySelectorAll('*').forEach(function(el) {
-                    var animations = el.getAnimations();
-                    if (animations.length > 0) {
-                        animations.forEach(function(anim) {
-                            // Pause the animation at its current state
-                            anim.pause();
-                            window.__animationElements.push(anim);
-                        });
-                    }
-                });
+                log(f"Keyframes found: {', '.join(animations_info['animations'])}")
+            log(f"Elements with animations: {animations_info['animated_elements']}")
 
-                console.log('Paused ' + window.__animationElements.length + ' animations');
+            log("Animations triggered")
+            log("Allowed 0.1s for animations to initialize")
 
-                // Store animation start time for precise control
-                window.__animationStartTime = performance.now();
-            """)
-
-            # Check how many animations were paused
-            num_paused = driver.execute_script("return window.__animationElements ? window.__animationElements.length : 0;")
-            self.log(f"Paused {num_paused} CSS animations for frame-by-frame control")
+            num_paused = report['paused']
+            log(f"Paused {num_paused} CSS animations for frame-by-frame control")
 
             # Capture frames
-            self.log(f"=== FRAME CAPTURE ===")
-            self.log(f"Total frames to capture: {total_frames}")
-            self.log(f"Frame rate: {config.fps} FPS")
-            self.log(f"Duration: {config.duration}s")
-            self.log(f"Time between frames: {frame_time_s:.4f}s")
-            self.update_progress(0.3, "Capturing frames...")
-
-            for frame_num in range(total_frames):
-                frame_progress = 0.3 + (0.4 * (frame_num + 1) / total_frames)
-                self.update_progress(frame_progress, f"Frame {frame_num + 1}/{total_frames}")
+            log(f"=== FRAME CAPTURE ===")
+            log(f"Total frames to capture: {total_frames} (this worker: {start_frame}-{end_frame - 1})")
+            log(f"Frame rate: {config.fps} FPS")
+            log(f"Duration: {config.duration}s")
+            log(f"Time between frames: {frame_time_s:.4f}s")
+            log(f"Capture format: {screenshot_params['format']}")
+
+            # Page clock time of frame 0; every worker reaches the same point after setup
+            clock_origin_ms = driver.execute_script("return window.__clockTime();")
+
+            def seek_frame(frame_num):
+                # Control animation timing precisely using Web Animations API (window.__seekFrame),
+                # sent as a short Runtime.evaluate instead of re-sending the whole seek script.
+                # Each call is its own task, so promise callbacks queued by a frame run before the next
+                elapsed_ms = frame_num * frame_time_s * 1000
+                seek = driver.execute_cdp_cmd("Runtime.evaluate", {
+                    "expression": f"window.__seekFrame({clock_origin_ms + elapsed_ms}, {elapsed_ms})",
+                    "returnByValue": True,
+                })
+                if "exceptionDetails" in seek:
+                    raise RuntimeError(f"Frame seek failed: {seek['exceptionDetails'].get('text')}")
+
+            # Replay the frames before this range without capturing them, so page scripts
+            # arrive at start_frame exactly as they do in the worker that renders frame 0
+            if start_frame:
+                self.log(f"Worker {worker_index + 1}: replaying {start_frame} frames before its range")
+            for frame_num in range(start_frame):
+                if self.cancelled or abort.is_set():
+                    _release_driver(driver, script_ids)
+                    writer.shutdown(wait=False)
+                    return False
+                seek_frame(frame_num)
 
-                if self.cancelled:
-                    driver.quit()
-                    return None
+            for frame_num in range(start_frame, end_frame):
+                if self.cancelled or abort.is_set():
+                    _release_driver(driver, script_ids)
+                    self._abort_encoder(encoder, writer)
+                    return False
 
                 # Set animation time for this frame
                 # Capture animation at NORMAL speed - we'll slow down playback via FFmpeg FPS
-                elapsed_ms = frame_num * frame_time_s * 1000
-
                 if frame_num % 30 == 0:  # Log every 30 frames
                     elapsed_time = frame_num * frame_time_s
-                    self.log(f"Animation at {elapsed_time:.2f}s (frame {frame_num}), will play at {config.animation_speed}x speed")
-
-                # Control animation timing precisely using Web Animations API
-                driver.execute_script(f"""
-                    var elapsedMs = {elapsed_ms};
-                    var elapsedSeconds = elapsedMs / 1000.0;
-
-                    // Update all paused CSS animations to exact time
-                    if (window.__animationElements) {{
-                        window.__animationElements.forEach(function(anim) {{
-                            anim.currentTime = elapsedMs;
-                        }});
-                    }}
+                    log(f"Animation at {elapsed_time:.2f}s (frame {frame_num}), will play at {config.animation_speed}x speed")
 
-                    // Update time for CreateJS animations (seek to specific time)
-                    if (typeof createjs !== 'undefined' && createjs.Ticker) {{
-                        // Set Ticker time directly
-                        var tickEvent = new createjs.Event("tick");
-                        tickEvent.delta = 16.67; // Simulate 60fps tick
-                        tickEvent.time = elapsedMs;
-                        tickEvent.runTime = elapsedMs;
-                        createjs.Ticker._listeners.forEach(function(listener) {{
-                            if (listener && listener.handleEvent) {{
-                                listener.handleEvent(tickEvent);
-                            }}
-                        }});
-                    }}
-
-                    // Update GSAP global timeline to exact time
-                    if (typeof gsap !== 'undefined') {{
-                        // Seek GSAP global timeline to specific time
-                        if (gsap.globalTimeline) {{
-                            gsap.globalTimeline.time(elapsedSeconds);
-                        }}
-                        // Also update any explicit timelines
-                        if (gsap.exportRoot) {{
-                            var root = gsap.exportRoot();
-                            root.time(elapsedSeconds);
-                        }}
-                    }}
-
-                    // Update canvas animations that use requestAnimationFrame
-                    if (window.animationStartTime) {{
-                        window.animationStartTime = Date.now() - elapsedMs;
-                    }}
-
-                    // Force reflow
-                    document.body.offsetHeight;
-                """)
-
-                frame_path = os.path.join(frames_dir, f"frame_{frame_num:06d}.png")
-                temp_screenshot = frame_path + ".tmp.png"
+                seek_frame(frame_num)
 
                 # Take screenshot AFTER waiting
                 if frame_num == 0 or frame_num % 10 == 0 or frame_num == total_frames - 1:
-                    self.log(f"Capturing frame {frame_num + 1}/{total_frames}")
-                driver.save_screenshot(temp_screenshot)
-
-                # Save frames at TARGET resolution (proportionally scaled and centered)
-                with Image.open(temp_screenshot) as img:
-                    screenshot_w, screenshot_h = img.size
-
-                    # Technical screenshot analysis on first frame
-                    if frame_num == 0:
-                        self.log(f"=== SCREENSHOT ANALYSIS ===")
-                        self.log(f"Screenshot size: {screenshot_w}x{screenshot_h}")
-                        self.log(f"Expected size (target frame): {target_width}x{target_height}")
-
-                        if abs(screenshot_w - target_width) < 10 and abs(screenshot_h - target_height) < 10:
-                            self.log(f"Action: PROPORTIONAL SCALING SUCCESS!")
-                            self.log(f"Screenshot matches target frame")
-                            self.log(f"Content is scaled {scale_factor:.2f}x and centered")
-                            # Save as-is, already at target dimensions with padding
-                            img.save(frame_path)
-                        else:
-                            self.log(f"WARNING: Screenshot size mismatch")
-                            self.log(f"Expected: {target_width}x{target_height}, Got: {screenshot_w}x{screenshot_h}")
-                            # Resize to target if needed
-                            if screenshot_w != target_width or screenshot_h != target_height:
-                                resized = img.resize((target_width, target_height), Image.Resampling.LANCZOS)
-                                resized.save(frame_path)
-                            else:
-                                img.save(frame_path)
+                    log(f"Capturing frame {frame_num + 1}/{total_frames}")
+                frame_data = _capture_screenshot(driver, screenshot_params)
+
+                if encoder is None:
+                    # The first capture's size decides whether the encoder needs to scale
+                    with Image.open(io.BytesIO(frame_data)) as img:
+                        frame_size = img.size
+                    try:
+                        encoder = self._start_encoder(segment_path, stderr_path, config, frame_size,
+                                                      (target_width, target_height), fallback,
+                                                      faststart=(start_frame == 0 and end_frame == total_frames),
+                                                      threads=layout['encoder_threads'])
+                    except FileNotFoundError:
+                        self.log("=== FFMPEG NOT FOUND ===")
+                        self.log("FileNotFoundError: FFmpeg executable not found in PATH")
+                        self.log("Please install FFmpeg or check packages.txt on Streamlit Cloud")
+                        _release_driver(driver, script_ids)
+                        return False
+                    log(f"FFmpeg encoder started (PID: {encoder.pid})")
+
+                # Technical screenshot analysis on first frame
+                if frame_num == 0:
+                    screenshot_w, screenshot_h = frame_size
+                    log(f"=== SCREENSHOT ANALYSIS ===")
+                    log(f"Screenshot size: {screenshot_w}x{screenshot_h}")
+                    log(f"Expected size (target frame): {target_width}x{target_height}")
+
+                    if abs(screenshot_w - target_width) < 10 and abs(screenshot_h - target_height) < 10:
+                        log(f"Action: PROPORTIONAL SCALING SUCCESS!")
+                        log(f"Screenshot matches target frame")
+                        log(f"Content is scaled {scale_factor:.2f}x and centered")
                     else:
-                        # For subsequent frames, just save as-is
-                        img.save(frame_path)
+                        log(f"WARNING: Screenshot size mismatch")
+                        log(f"Expected: {target_width}x{target_height}, Got: {screenshot_w}x{screenshot_h}")
+                        log(f"FFmpeg will scale frames to the target size")
 
                     # REQUIREMENT #7: Output debug frame 'frame_fixed.png'
-                    if frame_num == 0:
-                        debug_frame = os.path.join(output_dir, "frame_fixed.png")
-                        with Image.open(frame_path) as fixed_img:
-                            fixed_img.save(debug_frame)
-                            final_w, final_h = fixed_img.size
-                            self.log(f"=== DEBUG FRAME OUTPUT ===")
-                            self.log(f"Saved: frame_fixed.png")
-                            self.log(f"Frame dimensions: {final_w}x{final_h}")
-                            self.log(f"Content: {config.width}x{config.height} scaled {scale_factor:.2f}x = {scaled_width}x{scaled_height}")
-                            self.log(f"Padding: {pad_x}px H, {pad_y}px V (background: {bg_color_hex})")
-
-                os.unlink(temp_screenshot)
+                    debug_frame = os.path.join(work_dir, "frame_fixed.png")
+                    # Saved as captured: any resize to the target happens once, in FFmpeg's scale filter
+                    with Image.open(io.BytesIO(frame_data)) as fixed_img:
+                        fixed_img.save(debug_frame)
+                        final_w, final_h = fixed_img.size
+                    log(f"=== DEBUG FRAME OUTPUT ===")
+                    log(f"Saved: frame_fixed.png")
+                    log(f"Frame dimensions: {final_w}x{final_h}")
+                    log(f"Content: {config.width}x{config.height} scaled {scale_factor:.2f}x = {scaled_width}x{scaled_height}")
+                    log(f"Padding: {pad_x}px H, {pad_y}px V (background: {bg_color_hex})")
+
+                # Hand the frame to the writer thread so the pipe write (which blocks while
+                # FFmpeg catches up) overlaps the next seek and screenshot; one write in flight
+                try:
+                    if pending_write is not None:
+                        pending_write.result()
+                    pending_write = writer.submit(encoder.stdin.write, frame_data)
+                except BrokenPipeError:
+                    self.log(f"ERROR: FFmpeg exited while encoding frame {frame_num + 1}")
+                    _release_driver(driver, script_ids)
+                    self._finish_encoder(encoder, stderr_path, verbose=False)
+                    writer.shutdown(wait=False)
+                    return False
 
                 if frame_num == 0 or frame_num % 10 == 0 or frame_num == total_frames - 1:
-                    self.log(f"Frame {frame_num + 1} saved: {os.path.basename(frame_path)}")
+                    log(f"Frame {frame_num + 1} sent to encoder")
 
-            self.log(f"=== FRAME CAPTURE COMPLETE ===")
-            self.log(f"Total frames captured: {total_frames}")
-            self.log(f"Frames directory: {frames_dir}")
+                frames_done[worker_index] += 1
 
-            driver.quit()
-            self.log("Browser closed")
+            _release_driver(driver, script_ids)
+            log("Browser released")
+
+            if pending_write is not None:
+                try:
+                    pending_write.result()
+                except BrokenPipeError:
+                    pass  # FFmpeg exited early; its exit code is reported below
+            writer.shutdown()
+
+            if encoder is not None and not self._finish_encoder(encoder, stderr_path, verbose=start_frame == 0):
+                return False
 
         except Exception as e:
             self.log(f"=== RENDERING ERROR ===")
@@ -1034,320 +1723,10 @@ class HTML5ToVideoConverter:
                 self.log("Browser closed after error")
             except Exception:
                 self.log("Failed to close browser")
-            return None, None
-
-        # Frames are already at target dimensions with proportional scaling and padding
-        # No additional FFmpeg processing needed
-        self.log(f"=== FRAME RENDERING COMPLETE ===")
-        self.log(f"Frames ready at target dimensions: {target_width}x{target_height}")
-        self.log(f"Proportional scaling applied: {scale_factor:.2f}x (no stretching)")
-        self.log(f"No FFmpeg padding needed - frames are ready for encoding")
-        return frames_dir, None
-
-    def encode_video(self, frames_dir: str, output_path: str, config: VideoConfig, padding_info: dict = None) -> bool:
-        """Encode frames to video using FFmpeg
-
-        Args:
-            frames_dir: Directory containing frames
-            output_path: Output video file path
-            config: Video configuration
-            padding_info: Optional dict with padding info for format conversion
-                         {'bg_color': '#rrggbb', 'source_width': int, 'source_height': int,
-                          'target_width': int, 'target_height': int}
-        """
-        self.log(f"=== VIDEO ENCODING ===")
-        self.log(f"Frames directory: {frames_dir}")
-        self.log(f"Output path: {output_path}")
-        if padding_info:
-            self.log(f"Format conversion: {padding_info['source_width']}x{padding_info['source_height']} → {padding_info['target_width']}x{padding_info['target_height']}")
-            self.log(f"Padding color: {padding_info['bg_color']}")
-
-        input_pattern = os.path.join(frames_dir, "frame_%06d.png")
-        self.log(f"Input pattern: {input_pattern}")
-
-        # Check if frames exist first
-        frame_files = sorted([f for f in os.listdir(frames_dir) if f.endswith('.png')])
-        self.log(f"Checking for frames in: {frames_dir}")
-        self.log(f"Found {len(frame_files)} PNG files")
-
-        if not frame_files:
-            self.log("ERROR: No frames found to encode!")
+            self._abort_encoder(encoder, writer)
             return False
 
-        self.log(f"Frame files: {frame_files[0]} ... {frame_files[-1]}")
-        self.update_progress(0.75, "Encoding video...")
-
-        # Get frame dimensions and build FFmpeg filter
-        from PIL import Image
-        first_frame_path = os.path.join(frames_dir, frame_files[0])
-        self.log(f"=== DIMENSION CHECK ===")
-        self.log(f"Reading first frame: {frame_files[0]}")
-        needs_filter = False
-        video_filter = ""
-
-        try:
-            with Image.open(first_frame_path) as img:
-                frame_width, frame_height = img.size
-                self.log(f"Captured frame size: {frame_width}x{frame_height}")
-
-                # Build filter chain based on whether we need padding
-                filter_parts = []
-
-                if padding_info:
-                    # Frames are at native size, need to pad to target format
-                    src_w = padding_info['source_width']
-                    src_h = padding_info['source_height']
-                    tgt_w = padding_info['target_width']
-                    tgt_h = padding_info['target_height']
-                    bg_color = padding_info['bg_color'].lstrip('#')  # Remove # for FFmpeg
-
-                    # Calculate padding to center content
-                    # scale to fit (preserving aspect ratio)
-                    scale_x = tgt_w / src_w
-                    scale_y = tgt_h / src_h
-                    scale = min(scale_x, scale_y)
-
-                    scaled_w = int(src_w * scale)
-                    scaled_h = int(src_h * scale)
-
-                    # Ensure even dimensions for H.264
-                    scaled_w = scaled_w if scaled_w % 2 == 0 else scaled_w - 1
-                    scaled_h = scaled_h if scaled_h % 2 == 0 else scaled_h - 1
-                    tgt_w = tgt_w if tgt_w % 2 == 0 else tgt_w - 1
-                    tgt_h = tgt_h if tgt_h % 2 == 0 else tgt_h - 1
-
-                    # Calculate padding
-                    pad_x = (tgt_w - scaled_w) // 2
-                    pad_y = (tgt_h - scaled_h) // 2
-
-                    self.log(f"FFmpeg padding strategy:")
-                    self.log(f"  1. Scale: {src_w}x{src_h} → {scaled_w}x{scaled_h} (scale factor: {scale:.2f}x)")
-                    self.log(f"  2. Pad: Add {pad_x}px left/right, {pad_y}px top/bottom")
-                    self.log(f"  3. Final: {tgt_w}x{tgt_h} with color {bg_color}")
-
-                    # Build filter: scale, sharpen, then pad
-                    filter_parts.append(f"scale={scaled_w}:{scaled_h}:flags=lanczos")
-                    filter_parts.append("unsharp=5:5:1.0:5:5:0.0")
-                    filter_parts.append(f"pad={tgt_w}:{tgt_h}:{pad_x}:{pad_y}:color=0x{bg_color}")
-
-                    video_filter = f"-vf {','.join(filter_parts)}"
-                    needs_filter = True
-
-                else:
-                    # No format change, just ensure even dimensions and sharpen
-                    target_width = frame_width if frame_width % 2 == 0 else frame_width - 1
-                    target_height = frame_height if frame_height % 2 == 0 else frame_height - 1
-
-                    if frame_width != target_width or frame_height != target_height:
-                        video_filter = f"-vf scale={target_width}:{target_height}:flags=lanczos,unsharp=5:5:1.0:5:5:0.0"
-                        self.log(f"Adjusting for even dimensions: {frame_width}x{frame_height} → {target_width}x{target_height}")
-                    else:
-                        video_filter = "-vf unsharp=5:5:1.0:5:5:0.0"
-                        self.log(f"Frames at native size ({frame_width}x{frame_height}) - adding sharpen only")
-                    needs_filter = True
-
-        except Exception as e:
-            self.log(f"ERROR: Could not read frame: {e}")
-            # Fallback
-            if padding_info:
-                tgt_w = padding_info['target_width']
-                tgt_h = padding_info['target_height']
-            else:
-                tgt_w = config.width
-                tgt_h = config.height
-            tgt_w = tgt_w if tgt_w % 2 == 0 else tgt_w - 1
-            tgt_h = tgt_h if tgt_h % 2 == 0 else tgt_h - 1
-            video_filter = f"-vf scale={tgt_w}:{tgt_h}:flags=lanczos,unsharp=5:5:1.0:5:5:0.0"
-            needs_filter = True
-            self.log(f"Using fallback dimensions: {tgt_w}x{tgt_h}")
-
-        # Build FFmpeg command with maximum compatibility
-        self.log(f"=== BUILDING FFMPEG COMMAND ===")
-        self.log(f"Codec: {config.codec}")
-        self.log(f"FPS: {config.fps}")
-        self.log(f"CRF: {config.crf}")
-        self.log(f"Preset: {config.preset}")
-        self.log(f"Bitrate: {config.bitrate}")
-
-        # Calculate effective output FPS based on animation speed
-        # If animation_speed = 0.85, we want video to play 15% slower
-        # So output FPS should be 85% of capture FPS (60 * 0.85 = 51 FPS)
-        output_fps = config.fps * config.animation_speed
-        self.log(f"Animation speed multiplier: {config.animation_speed}x")
-        self.log(f"Input framerate (capture): {config.fps} FPS")
-        self.log(f"Output framerate (playback): {output_fps:.2f} FPS")
-
-        ffmpeg_cmd = [
-            "ffmpeg",
-            "-y",  # Overwrite output
-            "-framerate", str(config.fps),  # Input: how fast frames were captured
-            "-i", input_pattern,
-        ]
-
-        # Only add video filter if needed
-        if needs_filter:
-            ffmpeg_cmd.extend(video_filter.split())
-            self.log(f"Added video filter to command: {video_filter}")
-
-        ffmpeg_cmd.extend([
-            "-c:v", config.codec,
-            "-pix_fmt", "yuv420p",
-            "-r", str(output_fps),  # Output framerate for playback speed control
-        ])
-
-        # Add codec-specific settings - keep it SIMPLE for cloud compatibility
-        if config.codec in ["libx264", "libx265"]:
-            # Use CRF for quality control
-            ffmpeg_cmd.extend(["-crf", str(config.crf)])
-            ffmpeg_cmd.extend(["-preset", config.preset])
-            self.log(f"Using preset: {config.preset}, CRF: {config.crf}")
-        elif config.codec == "libvpx-vp9":
-            ffmpeg_cmd.extend(["-b:v", config.bitrate])
-            ffmpeg_cmd.extend(["-crf", str(config.crf)])
-            self.log(f"Using VP9 codec with bitrate and CRF")
-        else:
-            # For other codecs, use simple bitrate
-            ffmpeg_cmd.extend(["-b:v", config.bitrate])
-            self.log(f"Using simple bitrate for codec: {config.codec}")
-
-        # Add universal compatibility flags
-        ffmpeg_cmd.extend(["-movflags", "+faststart"])
-        self.log(f"Added faststart flag for web compatibility")
-
-        # Add output path
-        ffmpeg_cmd.append(output_path)
-
-        try:
-            # Log FFmpeg command
-            ffmpeg_command_str = " ".join(ffmpeg_cmd)
-            self.log(f"=== FFMPEG EXECUTION ===")
-            self.log(f"Command: {ffmpeg_command_str}")
-            self.log("Starting FFmpeg process...")
-
-            process = subprocess.Popen(
-                ffmpeg_cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True
-            )
-
-            self.log(f"FFmpeg process started (PID: {process.pid})")
-            self.log("Waiting for FFmpeg to complete...")
-
-            # Poll process and check for cancellation
-            while process.poll() is None:
-                if self.cancelled:
-                    self.log("Cancellation detected, terminating FFmpeg process...")
-                    process.terminate()
-                    try:
-                        process.wait(timeout=5)
-                    except subprocess.TimeoutExpired:
-                        self.log("FFmpeg did not terminate, forcing kill...")
-                        process.kill()
-                    self.log("FFmpeg process terminated by user cancellation")
-                    return False
-                time.sleep(0.1)
-
-            # Capture output
-            stdout, stderr = process.communicate()
-
-            self.log(f"FFmpeg process finished (exit code: {process.returncode})")
-
-            if process.returncode == 0:
-                self.log(f"=== FFMPEG OUTPUT ===")
-                for line in stderr.strip().split('\n'):
-                    if line.strip():
-                        self.log(line)
-                self.log("=== ENCODING SUCCESS ===")
-                self.log("Video encoding complete (exit code 0)")
-                return True
-            else:
-                # Log detailed error
-                self.log(f"=== FFMPEG ERROR ===")
-                self.log(f"Exit code: {process.returncode}")
-                self.log(f"STDERR output:")
-                for line in stderr.strip().split('\n'):
-                    if line.strip():
-                        self.log(line)
-
-                # Try fallback with minimal parameters
-                self.log("=== ATTEMPTING FALLBACK ENCODING ===")
-                self.log("Primary encoding failed, trying fallback with minimal parameters...")
-
-                # Get actual frame dimensions from first frame
-                try:
-                    from PIL import Image
-                    first_frame_path = os.path.join(frames_dir, frame_files[0])
-                    with Image.open(first_frame_path) as img:
-                        fw, fh = img.size
-                        # Ensure even dimensions
-                        fw = fw if fw % 2 == 0 else fw - 1
-                        fh = fh if fh % 2 == 0 else fh - 1
-                        self.log(f"Fallback dimensions from frame: {fw}x{fh}")
-                except Exception as e:
-                    fw, fh = 1280, 720  # Safe default
-                    self.log(f"Could not read frame for fallback: {e}")
-                    self.log(f"Using safe default: {fw}x{fh}")
-
-                fallback_fps = min(config.fps, 30)
-                self.log(f"Fallback FPS: {fallback_fps} (capped at 30)")
-
-                fallback_cmd = [
-                    "ffmpeg", "-y",
-                    "-framerate", str(fallback_fps),
-                    "-i", input_pattern,
-                    "-vf", f"scale={fw}:{fh}:flags=lanczos,unsharp=5:5:1.0:5:5:0.0",
-                    "-c:v", "libx264",
-                    "-pix_fmt", "yuv420p",
-                    "-profile:v", "baseline",
-                    "-level", "3.0",
-                    "-r", str(fallback_fps),
-                    output_path
-                ]
-
-                fallback_cmd_str = " ".join(fallback_cmd)
-                self.log(f"Fallback command: {fallback_cmd_str}")
-                self.log("Starting fallback FFmpeg process...")
-
-                fallback_process = subprocess.Popen(
-                    fallback_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    universal_newlines=True
-                )
-
-                self.log(f"Fallback process started (PID: {fallback_process.pid})")
-                fallback_stdout, fallback_stderr = fallback_process.communicate()
-                self.log(f"Fallback process finished (exit code: {fallback_process.returncode})")
-
-                if fallback_process.returncode == 0:
-                    self.log("=== FALLBACK SUCCESS ===")
-                    self.log("Fallback encoding succeeded using baseline profile")
-                    for line in fallback_stderr.strip().split('\n'):
-                        if line.strip():
-                            self.log(line)
-                    return True
-                else:
-                    self.log("=== FALLBACK FAILED ===")
-                    self.log(f"Fallback exit code: {fallback_process.returncode}")
-                    self.log("Fallback STDERR:")
-                    for line in fallback_stderr.strip().split('\n'):
-                        if line.strip():
-                            self.log(line)
-                    return False
-
-        except FileNotFoundError:
-            self.log("=== FFMPEG NOT FOUND ===")
-            self.log("FileNotFoundError: FFmpeg executable not found in PATH")
-            self.log("Please install FFmpeg or check packages.txt on Streamlit Cloud")
-            return False
-        except Exception as e:
-            self.log("=== ENCODING EXCEPTION ===")
-            self.log(f"Exception type: {type(e).__name__}")
-            self.log(f"Exception message: {str(e)}")
-            import traceback
-            self.log(f"Traceback:\n{traceback.format_exc()}")
-            return False
+        return True
 
     def convert(self, zip_path: str, output_path: str, config: VideoConfig) -> bool:
         """Main conversion pipeline"""
@@ -1355,6 +1734,13 @@ class HTML5ToVideoConverter:
         self.log(f"Input ZIP: {zip_path}")
         self.log(f"Output video: {output_path}")
 
+        # Fail before extracting anything when the encoder can't run at all
+        if shutil.which("ffmpeg") is None:
+            self.log("=== FFMPEG NOT FOUND ===")
+            self.log("FFmpeg executable not found in PATH")
+            self.log("Please install FFmpeg or check packages.txt on Streamlit Cloud")
+            return False
+
         temp_dir = tempfile.mkdtemp(prefix="html5_to_video_")
         self.log(f"Created temp directory: {temp_dir}")
 
@@ -1366,15 +1752,8 @@ class HTML5ToVideoConverter:
                 return False
             self.log(f"ZIP extraction successful: {html_path}")
 
-            self.log("=== STEP 2: RENDER HTML TO FRAMES ===")
-            frames_dir, padding_info = self.render_html_to_frames(html_path, temp_dir, config)
-            if not frames_dir:
-                self.log("ERROR: Frame rendering failed")
-                return False
-            self.log(f"Frame rendering successful: {frames_dir}")
-
-            self.log("=== STEP 3: ENCODE VIDEO ===")
-            success = self.encode_video(frames_dir, output_path, config, padding_info)
+            self.log("=== STEP 2: RENDER AND ENCODE VIDEO ===")
+            success = self.render_html_to_video(html_path, temp_dir, output_path, config)
 
             if success:
                 file_size = os.path.getsize(output_path) / (1024 * 1024)
@@ -1383,7 +1762,7 @@ class HTML5ToVideoConverter:
                 self.log(f"File size: {file_size:.2f} MB")
                 self.log(f"Total conversion time: {self._get_elapsed_time()}")
             else:
-                self.log("ERROR: Video encoding failed")
+                self.log("ERROR: Video rendering or encoding failed")
 
             return success
 
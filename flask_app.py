@@ -8,7 +8,6 @@ from flask import Flask, render_template, request, send_file, jsonify, Response
 import os
 import tempfile
 import zipfile
-from pathlib import Path
 import shutil
 
 # Import the converter classes from standalone converter module
@@ -131,29 +130,11 @@ def analyze():
         else:
             return jsonify({'error': 'Invalid file type'}), 400
 
-        # Extract and analyze
-        extract_dir = os.path.join(temp_dir, 'extract')
-        os.makedirs(extract_dir)
-
-        with zipfile.ZipFile(temp_zip, 'r') as zip_ref:
-            zip_ref.extractall(extract_dir)
-
-        html_files = list(Path(extract_dir).rglob("*.html"))
-
-        if not html_files:
+        # Analyze the main HTML straight from the archive; nothing is extracted to disk
+        detected = HTML5Analyzer.analyze_zip(temp_zip)
+        if detected is None:
             return jsonify({'error': 'No HTML files found'}), 400
 
-        main_html = None
-        for html_file in html_files:
-            if html_file.name.lower() in ['index.html', 'index.htm']:
-                main_html = html_file
-                break
-        if not main_html:
-            main_html = html_files[0]
-
-        analyzer = HTML5Analyzer()
-        detected = analyzer.analyze_html(str(main_html))
-
         # Get format recommendation
         auto_width, auto_height, auto_format = FormatCSS.detect_best_format(
             detected['width'], detected['height']
@@ -208,28 +189,11 @@ def convert():
         else:
             return jsonify({'error': 'Invalid file type'}), 400
 
-        # Analyze to get dimensions
-        extract_dir = os.path.join(temp_dir, 'extract')
-        os.makedirs(extract_dir)
-
-        with zipfile.ZipFile(temp_zip, 'r') as zip_ref:
-            zip_ref.extractall(extract_dir)
-
-        html_files = list(Path(extract_dir).rglob("*.html"))
-        if not html_files:
+        # Analyze the main HTML straight from the archive to get dimensions; nothing is extracted to disk
+        detected = HTML5Analyzer.analyze_zip(temp_zip)
+        if detected is None:
             return jsonify({'error': 'No HTML files found'}), 400
 
-        main_html = None
-        for html_file in html_files:
-            if html_file.name.lower() in ['index.html', 'index.htm']:
-                main_html = html_file
-                break
-        if not main_html:
-            main_html = html_files[0]
-
-        analyzer = HTML5Analyzer()
-        detected = analyzer.analyze_html(str(main_html))
-
         # Create config
         config = VideoConfig(
             width=detected['width'],
@@ -238,8 +202,8 @@ def convert():
             duration=duration,
             codec="libx264",
             bitrate="10M",
-            preset="slow",
-            crf=18,
+            preset="veryfast",
+            crf=20,
             animation_speed=1.0,
             target_format=target_format
         )
@@ -0,0 +1,49 @@
+import os
+import sys
+import tempfile
+import unittest
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from converter import HTML5Analyzer, HTML5ToVideoConverter  # noqa: E402
+
+
+def _page(width, height):
+    return f'<html><head><meta name="ad.size" content="width={width},height={height}"></head><body></body></html>'
+
+
+class MainHtmlSelectionTest(unittest.TestCase):
+    """analyze_zip and extract_zip must pick the same entry page"""
+
+    def setUp(self):
+        self.work_dir = tempfile.mkdtemp()
+        self.zip_path = os.path.join(self.work_dir, 'bundle.zip')
+
+    def _write_zip(self, members):
+        with zipfile.ZipFile(self.zip_path, 'w') as zf:
+            for name, content in members:
+                zf.writestr(name, content)
+
+    def _extracted_member(self):
+        extract_dir = os.path.join(self.work_dir, 'extract')
+        html_path = HTML5ToVideoConverter().extract_zip(self.zip_path, extract_dir)
+        return os.path.relpath(html_path, extract_dir).replace(os.sep, '/')
+
+    def test_shallowest_non_index_page_wins_regardless_of_member_order(self):
+        self._write_zip([('assets/promo.html', _page(300, 600)), ('banner.html', _page(336, 280))])
+
+        detected = HTML5Analyzer.analyze_zip(self.zip_path)
+        self.assertEqual((detected['width'], detected['height']), (336, 280))
+        self.assertEqual(self._extracted_member(), 'banner.html')
+
+    def test_index_page_wins_over_shallower_page(self):
+        self._write_zip([('banner.html', _page(336, 280)), ('ad/index.html', _page(300, 250))])
+
+        detected = HTML5Analyzer.analyze_zip(self.zip_path)
+        self.assertEqual((detected['width'], detected['height']), (300, 250))
+        self.assertEqual(self._extracted_member(), 'ad/index.html')
+
+
+if __name__ == '__main__':
+    unittest.main()